@@ -4,8 +4,9 @@ from pydantic import BaseModel, Field
 from typing import Optional
 from app.enhancement.prompts import ModelSpecificPrompts
 from app.shared.config import config
-import json
+import httpx
 import openai
+import orjson
 
 try:
     from openai import AsyncOpenAI
@@ -14,6 +15,40 @@ except ImportError:
 
 router = APIRouter(tags=["enhancement"])
 
+SSE_DONE = b"data: [DONE]\n\n"
+
+# Shared OpenAI client, created on first use so a missing key fails the request, not startup
+_openai_client: Optional[AsyncOpenAI] = None
+
+def get_openai_client() -> AsyncOpenAI:
+    """Return the process-wide client so requests reuse its keep-alive connection pool"""
+    global _openai_client
+    if _openai_client is None:
+        api_key = config.settings.openai_api_key
+        if not api_key:
+            # Fail this request before allocating a connection pool
+            raise openai.OpenAIError("OPENAI_API_KEY is not configured")
+        _openai_client = AsyncOpenAI(
+            api_key=api_key,
+            # HTTP/2 lets concurrent streams multiplex over a few pooled connections
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60)
+            )
+        )
+    return _openai_client
+
+async def close_openai_client():
+    """Close the shared client and its httpx pool (called on app shutdown)"""
+    global _openai_client
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
+
+def sse_event(event_type: str, data: str) -> bytes:
+    """Encode one SSE frame with orjson (bytes out, no str re-encode)"""
+    return b"data: " + orjson.dumps({"type": event_type, "data": data}) + b"\n\n"
+
 class EnhanceRequest(BaseModel):
     """Request model for prompt enhancement"""
     prompt: str = Field(..., description="The prompt to enhance", min_length=1)
@@ -34,20 +69,17 @@ async def stream_enhance_prompt(request: EnhanceRequest, x_user_id: str = Header
     async def generate_stream():
         """Generate word-by-word streaming response from OpenAI API"""
         try:
-            # Get system prompt for target model
-            system_prompt = ModelSpecificPrompts.get_system_prompt(target_model)
+            # Cached system message for target model + this request's user turn
+            messages = ModelSpecificPrompts.create_enhancement_messages(request.prompt, target_model)
             
-            # Initialize OpenAI client
-            client = AsyncOpenAI(api_key=config.settings.openai_api_key)
+            # Reuse the shared OpenAI client
+            client = get_openai_client()
             
             # Call OpenAI API with streaming
             # Using GPT-5-mini with token limit for cost control
             stream = await client.chat.completions.create(
                 model="gpt-5-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"Please enhance this prompt:\n\n{request.prompt}"}
-                ],
+                messages=messages,
                  # Balanced creativity
                 stream=True,
                 timeout=30
@@ -62,14 +94,14 @@ async def stream_enhance_prompt(request: EnhanceRequest, x_user_id: str = Header
                     if delta and delta.content:
                         content = delta.content
                         accumulated_text += content
-                        yield f"data: {json.dumps({'type': 'chunk', 'data': content})}\n\n"
+                        yield sse_event("chunk", content)
             
             # Send completion message
-            yield f"data: {json.dumps({'type': 'complete', 'data': accumulated_text})}\n\n"
-            yield "data: [DONE]\n\n"
+            yield sse_event("complete", accumulated_text)
+            yield SSE_DONE
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'data': f'Enhancement failed: {str(e)}'})}\n\n"
-            yield "data: [DONE]\n\n"
+            yield sse_event("error", f"Enhancement failed: {str(e)}")
+            yield SSE_DONE
     
     return StreamingResponse(
         generate_stream(),
@@ -1,6 +1,20 @@
+from functools import lru_cache
+
+
 class ModelSpecificPrompts:
     """Model-specific prompt templates for different AI models"""
     
+    DEFAULT_SYSTEM_PROMPT = "You are a helpful AI assistant."
+    
+    # (prompt key, model name fragments), checked in order:
+    # OpenAI, Anthropic Claude, Perplexity (before Gemini to avoid 'pro' conflict), Google Gemini
+    MODEL_FAMILIES = (
+        ("gpt-5", ("gpt-5", "gpt-4o", "gpt-4", "gpt-3.5", "chatgpt")),
+        ("claude", ("claude", "sonnet", "opus", "haiku")),
+        ("perplexity", ("perplexity", "sonar")),
+        ("gemini", ("gemini", "flash", "pro")),
+    )
+    
     @staticmethod
     def get_system_prompt(target_model: str) -> str:
         """
@@ -15,28 +29,42 @@ class ModelSpecificPrompts:
         # Normalize model name for easier matching
         model_lower = target_model.lower()
         
-        # Get model-specific prompts
-        model_prompts = ModelSpecificPrompts._get_model_specific_prompts_v2()
+        # Get model-specific prompts (built once at import)
+        model_prompts = ModelSpecificPrompts.MODEL_PROMPTS
+        
+        # First family with a matching name fragment wins
+        for family, fragments in ModelSpecificPrompts.MODEL_FAMILIES:
+            if any(fragment in model_lower for fragment in fragments):
+                return model_prompts.get(family, ModelSpecificPrompts.DEFAULT_SYSTEM_PROMPT)
         
-        # OpenAI models
-        if any(gpt in model_lower for gpt in ['gpt-5', 'gpt-4o', 'gpt-4', 'gpt-3.5', 'chatgpt']):
-            result = model_prompts.get("gpt-5", "You are a helpful AI assistant.")
-            return result
-        # Anthropic Claude models
-        elif any(claude in model_lower for claude in ['claude', 'sonnet', 'opus', 'haiku']):
-            result = model_prompts.get("claude", "You are a helpful AI assistant.")
-            return result
-        # Perplexity models (check first to avoid 'pro' conflict)
-        elif any(perplexity in model_lower for perplexity in ['perplexity', 'sonar']):
-            result = model_prompts.get("perplexity", "You are a helpful AI assistant.")
-            return result
-        # Google Gemini models
-        elif any(gemini in model_lower for gemini in ['gemini', 'flash', 'pro']):
-            result = model_prompts.get("gemini", "You are a helpful AI assistant.")
-            return result
+        return ModelSpecificPrompts.DEFAULT_SYSTEM_PROMPT
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_system_message(target_model: str) -> dict:
+        """
+        System chat message for the target model, resolved and built once per model name
+        
+        The returned dict is shared between requests - do not mutate it.
+        """
+        return {"role": "system", "content": ModelSpecificPrompts.get_system_prompt(target_model)}
+    
+    @staticmethod
+    def create_enhancement_messages(prompt: str, target_model: str) -> list:
+        """
+        Build the chat messages for an enhancement request
         
-        default = "You are a helpful AI assistant."
-        return default
+        Args:
+            prompt: The user's prompt to enhance
+            target_model: The target model name
+            
+        Returns:
+            Cached system message followed by the per-request user message
+        """
+        return [
+            ModelSpecificPrompts.get_system_message(target_model),
+            {"role": "user", "content": f"Please enhance this prompt:\n\n{prompt}"}
+        ]
         
 
     @staticmethod
@@ -714,4 +742,8 @@ Explain:
 3. How this differs on other planets (e.g., Mars)."
 
 Transform the user's input now.'''
-        }
\ No newline at end of file
+        }
+
+
+# Model-specific prompt table, built once per process - treat as read-only
+ModelSpecificPrompts.MODEL_PROMPTS = ModelSpecificPrompts._get_model_specific_prompts_v2()
@@ -4,7 +4,7 @@ Lightweight, high-performance in-memory rate limiter.
 import time
 from collections import defaultdict, deque
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 class SimpleRateLimiter:
     """
@@ -17,16 +17,21 @@ class SimpleRateLimiter:
         self.limit = 100
         self.window = 3600  # 1 hour in seconds
         
-        # Whitelisted paths (Auth, Health)
-        self.whitelist = {
+        # Idle clients are swept periodically so the map stays bounded
+        self.sweep_interval = 300  # 5 minutes in seconds
+        self._last_sweep = time.monotonic()
+        
+        # Whitelisted path prefixes (Auth, Health) - a tuple so one
+        # str.startswith call checks them all
+        self.whitelist = (
             "/api/v1/auth", "/api/v1/signin", "/api/v1/login",
             "/api/v1/users", "/health", "/api/v1/health"
-        }
+        )
 
     async def __call__(self, request: Request, call_next):
         # 1. Check Whitelist
         path = request.url.path
-        if any(path.startswith(w) for w in self.whitelist):
+        if path.startswith(self.whitelist):
             return await call_next(request)
 
         # 2. Identify Client (User ID > IP)
@@ -34,7 +39,7 @@ class SimpleRateLimiter:
         
         # 3. Check Limit
         if not self._allow_request(client_id):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=429,
                 content={"error": "Rate limit exceeded", "retry_after": 60}
             )
@@ -57,7 +62,8 @@ class SimpleRateLimiter:
 
     def _allow_request(self, client_id: str) -> bool:
         """Check if request is allowed."""
-        now = time.time()
+        now = time.monotonic()
+        self._sweep_idle_clients(now)
         history = self.requests[client_id]
         
         # Clean old requests
@@ -70,5 +76,16 @@ class SimpleRateLimiter:
         history.append(now)
         return True
 
+    def _sweep_idle_clients(self, now: float):
+        """Forget clients with no requests inside the window (runs at most once per interval)."""
+        if now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+        
+        cutoff = now - self.window
+        idle = [key for key, history in self.requests.items() if not history or history[-1] < cutoff]
+        for key in idle:
+            del self.requests[key]
+
 # Global instance
 rate_limiter = SimpleRateLimiter()
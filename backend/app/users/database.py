@@ -1,7 +1,10 @@
+import logging
 import aiohttp
 from typing import Dict, Optional, Any
 from app.shared.config import config
 
+logger = logging.getLogger(__name__)
+
 class DatabaseService:
     """
     Industry-grade Supabase Service Layer.
@@ -17,10 +20,36 @@ class DatabaseService:
             "Prefer": "return=representation"  # Ask Supabase to return the modified/created object
         }
         self.timeout = aiohttp.ClientTimeout(total=10)
+        # Pooled session, created lazily inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
         
         # Debug connection info (safely)
         if not self.base_url or "your_supabase" in self.base_url:
-            print(f"⚠️  WARNING: Invalid Supabase URL: {self.base_url}")
+            logger.warning("⚠️  Invalid Supabase URL: %s", self.base_url)
+
+    # =========================================================================
+    # CONNECTION POOL
+    # =========================================================================
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared session so requests reuse keep-alive connections
+        instead of paying a TCP+TLS handshake to Supabase on every call.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                # limit=0: no connection cap, so calls never queue for a free
+                # connection and burn their ClientTimeout budget waiting
+                connector=aiohttp.TCPConnector(limit=0, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the pooled session (called on app shutdown)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     # =========================================================================
     # CORE ENGINE (The "One Function to Rule Them All")
@@ -31,30 +60,30 @@ class DatabaseService:
         Unified request handler. Handles connection, auth, headers, and basic error parsing.
         """
         if not self.base_url or "your_supabase" in self.base_url:
-            print("❌ Error: Supabase URL not configured")
+            logger.error("❌ Error: Supabase URL not configured")
             return None
 
         url = f"{self.base_url}/{endpoint}"
         
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.request(method, url, headers=self.headers, params=params, json=json_data) as resp:
-                    if resp.status in [200, 201, 204]:
-                        # ALWAYS try to parse JSON (Supabase returns [] for empty results)
-                        try:
-                            result = await resp.json()
-                            return result
-                        except:
-                            return True  # Fallback for truly empty responses
-                    elif resp.status == 409: # Conflict
-                        return "CONFLICT"
-                    
-                    # Log error for non-success status
-                    error_text = await resp.text()
-                    print(f"❌ Supabase Request Failed: {method} {url} -> {resp.status} : {error_text}")
-                    return None
+            session = await self._get_session()
+            async with session.request(method, url, headers=self.headers, params=params, json=json_data) as resp:
+                if resp.status in [200, 201, 204]:
+                    # ALWAYS try to parse JSON (Supabase returns [] for empty results)
+                    try:
+                        result = await resp.json()
+                        return result
+                    except:
+                        return True  # Fallback for truly empty responses
+                elif resp.status == 409: # Conflict
+                    return "CONFLICT"
+                
+                # Log error for non-success status
+                error_text = await resp.text()
+                logger.error("❌ Supabase Request Failed: %s %s -> %s : %s", method, url, resp.status, error_text)
+                return None
         except Exception as e:
-            print(f"❌ Supabase Connection Error: {e}")
+            logger.error("❌ Supabase Connection Error: %s", e)
             return None
 
     # =========================================================================
@@ -71,20 +100,22 @@ class DatabaseService:
         # Handle the response
         if isinstance(data, list):
             if len(data) > 0:
-                print(f"✅ _get({table}) -> Found: {data[0].get('email', 'unknown')}")
+                logger.debug("✅ _get(%s) -> Found: %s", table, data[0].get('email', 'unknown'))
                 return data[0]
             else:
-                print(f"🔎 _get({table}) -> Empty (user not in DB)")
+                logger.debug("🔎 _get(%s) -> Empty (user not in DB)", table)
                 return None
         else:
-            print(f"⚠️ _get({table}) -> Unexpected: {type(data).__name__}")
+            logger.warning("⚠️ _get(%s) -> Unexpected: %s", table, type(data).__name__)
             return None
 
-    async def _update(self, table: str, query: Dict, data: Dict) -> bool:
-        """Generic UPDATE record."""
+    async def _update_returning(self, table: str, query: Dict, data: Dict) -> Optional[Dict]:
+        """Generic UPDATE record, returning the updated row in the same round-trip."""
         params = {k: f"eq.{v}" for k, v in query.items()}
         res = await self._request("PATCH", table, params=params, json_data=data)
-        return bool(res)
+        if isinstance(res, list) and len(res) > 0:
+            return res[0]
+        return None
 
     async def _create(self, table: str, data: Dict) -> Any:
         """Generic CREATE record."""
@@ -96,58 +127,56 @@ class DatabaseService:
 
     async def get_or_create_user(self, email: str, user_data: Dict) -> Dict:
         """Get existing user or create a new one."""
-        print(f"🔍 get_or_create_user: Looking for {email}")
+        logger.debug("🔍 get_or_create_user: Looking for %s", email)
         
         user = await self._get("users", {"email": email})
         if user: 
-            print(f"✅ Found existing user: {email}")
+            logger.debug("✅ Found existing user: %s", email)
             return user
         
         # Create new
-        print(f"🆕 Creating new user: {email}")
+        logger.info("🆕 Creating new user: %s", email)
         res = await self._create("users", user_data)
-        print(f"📝 Create result: {type(res).__name__} = {res}")
+        logger.debug("📝 Create result: %s = %s", type(res).__name__, res)
         
         if res == "CONFLICT":
-            print(f"⚠️ Conflict detected, fetching again...")
+            logger.warning("⚠️ Conflict detected, fetching again...")
             return await self._get("users", {"email": email})
             
         # Handle list response from Supabase
         if isinstance(res, list) and len(res) > 0:
-            print(f"✅ User created (list response)")
+            logger.debug("✅ User created (list response)")
             return res[0]
             
         # Handle simple success (no body returned)
         if res is True:
-            print(f"✅ User created (empty response), fetching...")
+            logger.debug("✅ User created (empty response), fetching...")
             return await self._get("users", {"email": email})
 
         if isinstance(res, dict):
-            print(f"✅ User created (dict response)")
+            logger.debug("✅ User created (dict response)")
             return res
             
-        print(f"❌ Failed to create user, res={res}")
+        logger.error("❌ Failed to create user, res=%s", res)
         return None
 
     async def get_user_stats(self, email: str) -> Optional[Dict]:
         """Get user profile data."""
         return await self._get("users", {"email": email})
 
-    async def increment_user_prompts(self, email: str) -> int:
-        """Increment user's enhanced_prompts count by 1."""
+    async def increment_user_prompts(self, email: str) -> Optional[Dict]:
+        """Increment user's enhanced_prompts count by 1 and return the updated user."""
         user = await self.get_user_stats(email)
         if not user:
-            # Auto-create if missing
-            await self.get_or_create_user(email, {"email": email, "name": "User"})
-            return 1
+            # Auto-create if missing, counting this call as the first prompt
+            return await self.get_or_create_user(email, {"email": email, "name": "User", "enhanced_prompts": 1})
 
         new_total = (user.get("enhanced_prompts", 0) or 0) + 1
         
-        success = await self._update("users", {"email": email}, {
+        # PATCH returns the updated row, so no follow-up GET is needed
+        return await self._update_returning("users", {"email": email}, {
             "enhanced_prompts": new_total
         })
-        
-        return new_total if success else 0
 
 # Global Instance
 database_service = DatabaseService()
@@ -1,3 +1,4 @@
+import logging
 from typing import Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, EmailStr
@@ -5,6 +6,8 @@ from pydantic import BaseModel, EmailStr
 # FIX: Import the SHARED instance, don't create a new one!
 from app.users.database import db_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["users"])
 
 class UserCreateRequest(BaseModel):
@@ -25,14 +28,14 @@ async def create_user(request: UserCreateRequest):
     """
     Login/Register: Check if user exists by email. If yes, return their data. If no, create them.
     """
-    print(f"📥 POST /users - email: {request.email}")
+    logger.info("📥 POST /users - email: %s", request.email)
     
     try:
         # Step 1: Check if user already exists (by EMAIL only)
         existing_user = await db_service.get_user_stats(request.email)
         
         if existing_user:
-            print(f"✅ User found: {request.email} (prompts: {existing_user.get('enhanced_prompts', 0)})")
+            logger.info("✅ User found: %s (prompts: %s)", request.email, existing_user.get('enhanced_prompts', 0))
             return UserResponse(
                 id=str(existing_user.get("id", "")),
                 email=existing_user.get("email", request.email),
@@ -42,7 +45,7 @@ async def create_user(request: UserCreateRequest):
             )
         
         # Step 2: User doesn't exist, create them
-        print(f"🆕 Creating new user: {request.email}")
+        logger.info("🆕 Creating new user: %s", request.email)
         user_data = {
             "email": request.email,
             "name": request.name,
@@ -52,10 +55,10 @@ async def create_user(request: UserCreateRequest):
         new_user = await db_service.get_or_create_user(request.email, user_data)
         
         if not new_user:
-            print(f"❌ Failed to create user: {request.email}")
+            logger.error("❌ Failed to create user: %s", request.email)
             raise HTTPException(status_code=500, detail="Database failed to create user")
         
-        print(f"✅ User created: {request.email}")
+        logger.info("✅ User created: %s", request.email)
         return UserResponse(
             id=str(new_user.get("id", "")),
             email=new_user.get("email", request.email),
@@ -67,7 +70,7 @@ async def create_user(request: UserCreateRequest):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error in create_user: {e}")
+        logger.exception("❌ Error in create_user: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create user: {str(e)}")
 
 @router.get("/users/{email}")
@@ -75,14 +78,14 @@ async def get_user_by_email(email: str):
     """
     Get user details by email. Creates user if not found (fallback for failed login POST).
     """
-    print(f"📥 GET /users/{email}")
+    logger.info("📥 GET /users/%s", email)
     
     try:
         user = await db_service.get_user_stats(email)
         
         # If user doesn't exist, create them (defensive fallback)
         if not user:
-            print(f"🆕 User not found, auto-creating: {email}")
+            logger.info("🆕 User not found, auto-creating: %s", email)
             user = await db_service.get_or_create_user(email, {
                 "email": email,
                 "name": "User",
@@ -90,10 +93,10 @@ async def get_user_by_email(email: str):
             })
         
         if not user:
-            print(f"❌ Failed to get/create user: {email}")
+            logger.error("❌ Failed to get/create user: %s", email)
             raise HTTPException(status_code=500, detail="Failed to get/create user")
         
-        print(f"✅ User ready: {email} (prompts: {user.get('enhanced_prompts', 0)})")
+        logger.info("✅ User ready: %s (prompts: %s)", email, user.get('enhanced_prompts', 0))
         return UserResponse(
             id=str(user.get("id", "")),
             email=user.get("email", email),
@@ -105,7 +108,7 @@ async def get_user_by_email(email: str):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error in get_user_by_email: {e}")
+        logger.exception("❌ Error in get_user_by_email: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed: {str(e)}")
 
 @router.post("/users/{email}/increment", response_model=UserResponse)
@@ -113,18 +116,16 @@ async def increment_user_count(email: str):
     """
     Add +1 to user's enhanced prompts count.
     """
-    print(f"📥 POST /users/{email}/increment")
+    logger.info("📥 POST /users/%s/increment", email)
     
     try:
-        # Increment the count (this also creates user if missing)
-        new_count = await db_service.increment_user_prompts(email)
-        print(f"✅ Incremented count for {email}: now {new_count}")
-        
-        # Get updated user data
-        user_data = await db_service.get_user_stats(email)
+        # Increment the count (this also creates user if missing) and get the updated row
+        user_data = await db_service.increment_user_prompts(email)
         if not user_data:
-            print(f"❌ User not found after increment: {email}")
-            raise HTTPException(status_code=404, detail="User not found")
+            logger.error("❌ Failed to increment count: %s", email)
+            raise HTTPException(status_code=500, detail="Database failed to increment user")
+        
+        logger.info("✅ Incremented count for %s: now %s", email, user_data.get('enhanced_prompts', 0))
         
         return UserResponse(
             id=str(user_data.get('id', '')),
@@ -137,5 +138,5 @@ async def increment_user_count(email: str):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error in increment: {e}")
+        logger.exception("❌ Error in increment: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to increment: {str(e)}")
\ No newline at end of file
@@ -1,24 +1,46 @@
 import sys
 import os
+import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
 # Add the backend directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# App logging: level from LOG_LEVEL (DEBUG shows per-query Supabase traces).
+# Configured before the app modules are imported so import-time warnings use it.
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+# httpx/httpcore log every upstream request at INFO; keep them to warnings
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("httpcore").setLevel(logging.WARNING)
+
 from fastapi import FastAPI, Body, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from app.enhancement import endpoints as enhance_router
 from app.users import endpoints as users_endpoints
 from app.shared.rate_limiter import rate_limiter
 from app.shared.config import config
+from app.users.database import db_service
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """App lifespan: release pooled upstream connections on shutdown"""
+    yield
+    await db_service.close()
+    await enhance_router.close_openai_client()
 
 app = FastAPI(
     title="PromptGrammerly API",
     description="your personal PromptEngineer",
     version="2.0.4",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Security middleware
@@ -71,7 +93,7 @@ async def health_check():
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     """Custom 404 handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "error": "Endpoint not found",
@@ -88,7 +110,7 @@ async def not_found_handler(request, exc):
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
     """Custom 500 handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",